@@ -0,0 +1,7 @@
+"""
+:mod:`benchmarks` measures the throughput of the :mod:`binio` reader and
+writer hot paths
+
+Run it with ``python -m benchmarks``, see ``python -m benchmarks --help``.
+
+"""
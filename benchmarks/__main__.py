@@ -0,0 +1,125 @@
+"""
+Run the benchmark suite::
+
+    $ python -m benchmarks -o results.json
+    $ python -m benchmarks --compare results.json
+
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Dict, List, Optional
+
+from .cases import Case, all_cases
+
+Results = Dict[str, Dict[str, float]]
+
+
+def run_case(case: Case, repeat: int) -> Dict[str, float]:
+    best = min(timeit.repeat(case.func, repeat=repeat, number=1))
+
+    return {
+        "ops": case.ops,
+        "bytes": case.nbytes,
+        "seconds": best,
+        "ops_per_sec": case.ops / best,
+        "mb_per_sec": case.nbytes / best / 1e6,
+    }
+
+
+def run(cases: List[Case], repeat: int) -> Results:
+    results = {}
+    for case in cases:
+        result = results[case.name] = run_case(case, repeat)
+        print(
+            f"{case.name:<40} {result['ops_per_sec']:>14,.0f} ops/s "
+            f"{result['mb_per_sec']:>10.2f} MB/s"
+        )
+
+    return results
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> int:
+    """
+    Print the relative change of ops/s against the baseline.
+
+    :returns: the number of cases that regressed by more than ``threshold``
+    """
+    regressions = 0
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        mark = ""
+        if change < -threshold:
+            mark = "  REGRESSION"
+            regressions += 1
+
+        print(f"{name:<40} {change:>+8.1%}{mark}")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the binio reader and writer hot paths.",
+    )
+    parser.add_argument(
+        "-n", type=int, default=10000, help="values per run (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="runs per case, the best one is reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="run only cases containing the substring"
+    )
+    parser.add_argument("-o", "--output", help="save the results to a JSON file")
+    parser.add_argument("--compare", help="compare with the results in a JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases(args.n) if args.filter in case.name]
+    results = run(cases, args.repeat)
+
+    if args.output:
+        report: Dict[str, Any] = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "n": args.n,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+        print()
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
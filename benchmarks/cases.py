@@ -0,0 +1,280 @@
+"""
+:mod:`benchmarks.cases` defines the benchmark cases
+
+Every :class:`Case` is a zero-argument callable performing ``ops``
+operations over ``nbytes`` bytes. The input data is prepared in advance
+with a fixed seed, so the runs are reproducible.
+
+"""
+
+import random
+import struct
+from functools import partial
+from typing import Any, Callable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from binio import (
+    BinaryReader,
+    BinaryWriter,
+    ByteOrder,
+    ColumnType,
+    CompressedBinaryReader,
+    CompressedBinaryWriter,
+    Compression,
+    read_columns,
+    write_records,
+)
+
+__all__ = ["Case", "all_cases"]
+
+SEED = 20240101
+
+
+class Case(NamedTuple):
+    name: str
+    func: Callable[[], None]
+    ops: int
+    nbytes: int
+
+
+# name, struct format, values generator
+_PRIMITIVES: List[Tuple[str, str, Callable[[random.Random], Any]]] = [
+    ("bool", "?", lambda rnd: rnd.random() < 0.5),
+    ("char", "c", lambda rnd: chr(rnd.randint(0, 2**7 - 1))),
+    ("int8", "b", lambda rnd: rnd.randint(-(2**7), 2**7 - 1)),
+    ("uint8", "B", lambda rnd: rnd.randint(0, 2**8 - 1)),
+    ("int16", "h", lambda rnd: rnd.randint(-(2**15), 2**15 - 1)),
+    ("uint16", "H", lambda rnd: rnd.randint(0, 2**16 - 1)),
+    ("int32", "i", lambda rnd: rnd.randint(-(2**31), 2**31 - 1)),
+    ("uint32", "I", lambda rnd: rnd.randint(0, 2**32 - 1)),
+    ("int64", "q", lambda rnd: rnd.randint(-(2**63), 2**63 - 1)),
+    ("uint64", "Q", lambda rnd: rnd.randint(0, 2**64 - 1)),
+    ("single", "f", lambda rnd: rnd.uniform(-1e6, 1e6)),
+    ("double", "d", lambda rnd: rnd.uniform(-1e300, 1e300)),
+]
+
+# name, upper bound of the encoded values; zero is not generated since
+# write_uleb128 emits no bytes for it
+_VARINTS = [
+    ("1b", 2**7),
+    ("3b", 2**21),
+    ("5b", 2**35),
+    ("10b", 2**64),
+]
+
+_STRING_LENGTHS = [8, 64, 1024]
+
+
+def _write_values(
+    writer: BinaryWriter, write: Callable[[Any], int], values: Sequence[Any]
+) -> None:
+    writer.reset()
+    for v in values:
+        write(v)
+
+
+def _read_values(
+    reader: BinaryReader, read: Callable[[], Any], data: bytes, n: int
+) -> None:
+    reader.reset(data)
+    for _ in range(n):
+        read()
+
+
+def _pack_values(pack: Callable[[Any], bytes], values: Sequence[Any]) -> None:
+    for v in values:
+        pack(v)
+
+
+def _unpack_values(
+    unpack_from: Callable[[bytes, int], Any], data: bytes, step: int
+) -> None:
+    for offset in range(0, len(data), step):
+        unpack_from(data, offset)
+
+
+def _write_compressed(writer: CompressedBinaryWriter, chunk: bytes, n: int) -> None:
+    writer.reset()
+    for _ in range(n):
+        writer.write(chunk)
+    writer.close()
+
+
+def _primitive_cases(n: int) -> Iterator[Case]:
+    for name, fmt, gen in _PRIMITIVES:
+        rnd = random.Random(SEED)
+        values = [gen(rnd) for _ in range(n)]
+        # struct packs a char as a bytes object of length 1
+        svalues = [v.encode() for v in values] if fmt == "c" else values
+        st = struct.Struct("<" + fmt)
+        data = b"".join(st.pack(v) for v in svalues)
+        size = len(data)
+
+        writer = BinaryWriter(ByteOrder.LITTLE)
+        write = getattr(writer, "write_" + name)
+        reader = BinaryReader(data, ByteOrder.LITTLE)
+        read = getattr(reader, "read_" + name)
+
+        write_case = partial(_write_values, writer, write, values)
+        read_case = partial(_read_values, reader, read, data, n)
+        pack_case = partial(_pack_values, st.pack, svalues)
+        unpack_case = partial(_unpack_values, st.unpack_from, data, st.size)
+
+        yield Case(f"write_{name}", write_case, n, size)
+        yield Case(f"read_{name}", read_case, n, size)
+        yield Case(f"struct.pack_{name}", pack_case, n, size)
+        yield Case(f"struct.unpack_{name}", unpack_case, n, size)
+
+
+def _varint_cases(n: int) -> Iterator[Case]:
+    for name, bound in _VARINTS:
+        rnd = random.Random(SEED)
+        values = [rnd.randint(bound // 128 or 1, bound - 1) for _ in range(n)]
+        signed = [v // 2 + 1 if i % 2 else -(v // 2) - 1 for i, v in enumerate(values)]
+
+        for method, vals in (("uleb128", values), ("zigzagint", signed)):
+            writer = BinaryWriter(ByteOrder.LITTLE)
+            write = getattr(writer, "write_" + method)
+            _write_values(writer, write, vals)
+            data = writer.bytes
+
+            reader = BinaryReader(data, ByteOrder.LITTLE)
+            read = getattr(reader, "read_" + method)
+
+            write_case = partial(_write_values, writer, write, vals)
+            read_case = partial(_read_values, reader, read, data, n)
+
+            yield Case(f"write_{method}[{name}]", write_case, n, len(data))
+            yield Case(f"read_{method}[{name}]", read_case, n, len(data))
+
+
+def _string_cases(n: int) -> Iterator[Case]:
+    for length in _STRING_LENGTHS:
+        rnd = random.Random(SEED)
+        count = max(n * 8 // length, 1)
+        alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+        strings = ["".join(rnd.choices(alphabet, k=length)) for _ in range(count)]
+
+        writer = BinaryWriter(ByteOrder.LITTLE)
+        _write_values(writer, writer.write_nullstr, strings)
+        nulldata = writer.bytes
+        strdata = "".join(strings).encode()
+        reader = BinaryReader(nulldata, ByteOrder.LITTLE)
+
+        write_nullstr_case = partial(
+            _write_values, writer, writer.write_nullstr, strings
+        )
+        write_str_case = partial(_write_values, writer, writer.write_str, strings)
+        read_nullstr_case = partial(
+            _read_values, reader, reader.read_nullstr, nulldata, count
+        )
+        read_str_case = partial(
+            _read_values, reader, partial(reader.read_str, length), strdata, count
+        )
+
+        nullsize = len(nulldata)
+        yield Case(f"write_nullstr[{length}]", write_nullstr_case, count, nullsize)
+        yield Case(f"read_nullstr[{length}]", read_nullstr_case, count, nullsize)
+        yield Case(f"write_str[{length}]", write_str_case, count, len(strdata))
+        yield Case(f"read_str[{length}]", read_str_case, count, len(strdata))
+
+
+def _large_buffer_cases(n: int) -> Iterator[Case]:
+    chunk = random.Random(SEED).randbytes(64 * 1024)
+    chunks = max(n // 256, 1)
+    size = chunks * len(chunk)
+    data = chunk * chunks
+    count = size // 8
+
+    writer = BinaryWriter(ByteOrder.LITTLE)
+    reader = BinaryReader(data, ByteOrder.LITTLE)
+
+    write_chunks_case = partial(_write_values, writer, writer.write, [chunk] * chunks)
+    read_uint64_case = partial(_read_values, reader, reader.read_uint64, data, count)
+    read_chunks_case = partial(
+        _read_values, reader, partial(reader.read, len(chunk)), data, chunks
+    )
+
+    yield Case("large.write_64k_chunks", write_chunks_case, chunks, size)
+    yield Case("large.read_uint64", read_uint64_case, count, size)
+    yield Case("large.read_64k_chunks", read_chunks_case, chunks, size)
+
+    for compression in (Compression.NONE, Compression.ZLIB):
+        name = compression.name.lower()
+        cwriter = CompressedBinaryWriter(ByteOrder.LITTLE, compression)
+        _write_compressed(cwriter, chunk, chunks)
+        archive = cwriter.bytes
+        creader = CompressedBinaryReader(archive, ByteOrder.LITTLE)
+
+        compressed_write_case = partial(_write_compressed, cwriter, chunk, chunks)
+        compressed_read_case = partial(
+            _read_values, creader, creader.read_uint64, archive, count
+        )
+
+        yield Case(
+            f"large.compressed_write[{name}]", compressed_write_case, chunks, size
+        )
+        yield Case(
+            f"large.compressed_read_uint64[{name}]", compressed_read_case, count, size
+        )
+
+
+def _columnar_cases(n: int) -> Iterator[Case]:
+    rnd = random.Random(SEED)
+    schema = [
+        ("id", ColumnType.UINT32),
+        ("price", ColumnType.DOUBLE),
+        ("name", ColumnType.STR),
+    ]
+    records = [
+        (i, rnd.uniform(0, 1e6), f"item-{rnd.randint(0, 10**6)}") for i in range(n)
+    ]
+
+    writer = BinaryWriter(ByteOrder.LITTLE)
+    write_records(writer, schema, records)
+    coldata = writer.bytes
+
+    def write_columnar_case() -> None:
+        writer.reset()
+        write_records(writer, schema, records)
+
+    def write_rows_case() -> None:
+        writer.reset()
+        for id_, price, name in records:
+            writer.write_uint32(id_)
+            writer.write_double(price)
+            writer.write_nullstr(name)
+
+    write_rows_case()
+    rowdata = writer.bytes
+    reader = BinaryReader(coldata, ByteOrder.LITTLE)
+
+    def read_columnar_case() -> None:
+        reader.reset(coldata)
+        read_columns(reader)
+
+    def read_rows_case() -> None:
+        reader.reset(rowdata)
+        for _ in range(n):
+            reader.read_uint32()
+            reader.read_double()
+            reader.read_nullstr()
+
+    yield Case("columnar.write_records", write_columnar_case, n, len(coldata))
+    yield Case("columnar.read_columns", read_columnar_case, n, len(coldata))
+    yield Case("columnar.write_rows_baseline", write_rows_case, n, len(rowdata))
+    yield Case("columnar.read_rows_baseline", read_rows_case, n, len(rowdata))
+
+
+def all_cases(n: int) -> List[Case]:
+    """
+    Build all the benchmark cases.
+
+    :param n: the number of values processed by a single run of a case
+    """
+    return [
+        *_primitive_cases(n),
+        *_varint_cases(n),
+        *_string_cases(n),
+        *_large_buffer_cases(n),
+        *_columnar_cases(n),
+    ]
@@ -1,5 +1,25 @@
 from .breader import BinaryReader
 from .bwriter import BinaryWriter
-from .enums import ByteOrder
+from .columnar import read_columns, write_columns, write_records
+from .compression import CompressedBinaryReader, CompressedBinaryWriter
+from .enums import ByteOrder, Checksum, ColumnType, Compression
+from .instrument import Instrumentation, instrument, uninstrument
+from .pool import WriterPool
 
-__all__ = ["ByteOrder", "BinaryWriter", "BinaryReader"]
+__all__ = [
+    "ByteOrder",
+    "BinaryWriter",
+    "BinaryReader",
+    "Checksum",
+    "Compression",
+    "CompressedBinaryWriter",
+    "CompressedBinaryReader",
+    "WriterPool",
+    "Instrumentation",
+    "instrument",
+    "uninstrument",
+    "ColumnType",
+    "write_columns",
+    "write_records",
+    "read_columns",
+]
@@ -6,9 +6,10 @@
 import io
 import struct
 import sys
-from typing import Optional, Union
+from typing import List, Optional, Union
 
-from .enums import ByteOrder
+from .checksum import RunningChecksum
+from .enums import ByteOrder, Checksum
 from .exceptions import NotEnoughBytes
 
 __all__ = ["BinaryReader"]
@@ -31,6 +32,7 @@ class BinaryReader:
             raise ValueError("Argumnet b must be bytes or io.BytesIO")
 
         self._stream = b
+        self._checksums: List[RunningChecksum] = []
 
         if byte_order is None:
             byte_order = ByteOrder.BIG if sys.byteorder == "big" else ByteOrder.LITTLE
@@ -56,6 +58,29 @@ class BinaryReader:
     def byte_order(self) -> ByteOrder:
         return self._byte_order
 
+    def tell(self) -> int:
+        """
+        Return the current position in the underlying stream
+
+        """
+        return self._stream.tell()
+
+    def reset(self, b: Union[io.BytesIO, bytes_]) -> None:
+        """
+        Make the reader ready to read the given buffer keeping
+        the byte order. Open checksum scopes are dropped.
+
+        :param b: the new buffer to read
+
+        """
+        if isinstance(b, bytes_):
+            b = io.BytesIO(b)
+        elif not isinstance(b, io.BytesIO):
+            raise ValueError("Argumnet b must be bytes or io.BytesIO")
+
+        self._stream = b
+        self._checksums.clear()
+
     def _ensure_bytes(self, n: Optional[int] = None) -> bytes_:
         """
         Try to read ``n`` bytes from the underlying storage and
@@ -81,8 +106,40 @@ class BinaryReader:
                 f"Not enough bytes to read. Asked {n} bytes, available {len(b)} bytes."
             )
 
+        if self._checksums:
+            self._update_checksums(b)
+
         return b
 
+    def _update_checksums(self, b: bytes_) -> None:
+        for checksum in self._checksums:
+            checksum.update(b)
+
+    def begin_checksum(self, algorithm: Checksum = Checksum.CRC32) -> None:
+        """
+        Open a checksum scope. Every byte read until the matching
+        :meth:`end_checksum` call is added to the running checksum.
+        Scopes can be nested.
+
+        :param algorithm: the checksum algorithm
+
+        """
+        self._checksums.append(RunningChecksum(algorithm))
+
+    def end_checksum(self) -> int:
+        """
+        Close the innermost checksum scope.
+
+        :returns: the checksum of the bytes read within the scope
+
+        :raises: RuntimeError: if there is no open checksum scope
+
+        """
+        if not self._checksums:
+            raise RuntimeError("There is no open checksum scope")
+
+        return self._checksums.pop().value
+
     def read_bool(self) -> bool:
         return bool(struct.unpack("?", self._ensure_bytes(1))[0])
 
@@ -8,9 +8,10 @@ from __future__ import annotations
 import io
 import struct
 import sys
-from typing import Optional, Union
+from typing import List, Optional, Union
 
-from .enums import ByteOrder
+from .checksum import RunningChecksum
+from .enums import ByteOrder, Checksum
 from .exceptions import OutOfRange
 
 __all__ = ["BinaryWriter"]
@@ -27,6 +28,8 @@ class BinaryWriter:
     def __init__(self, byte_order: Optional[ByteOrder]) -> None:
         self._stream = io.BytesIO()
         self._sz = 0
+        self._rewound = False
+        self._checksums: List[RunningChecksum] = []
 
         if byte_order is None:
             byte_order = ByteOrder.BIG if sys.byteorder == "big" else ByteOrder.LITTLE
@@ -49,7 +52,18 @@ class BinaryWriter:
 
     @property
     def bytes(self) -> bytes_:
-        return self._stream.getvalue()
+        """
+        Return bytes containing everything written to the underlying
+        stream. After :meth:`reset` the stale bytes beyond the written
+        ones are excluded.
+
+        :return: bytes
+        """
+        if not self._rewound:
+            return self._stream.getvalue()
+
+        with self._stream.getbuffer() as view:
+            return bytes(view[: self._sz])
 
     @property
     def size(self) -> int:
@@ -65,6 +79,48 @@ class BinaryWriter:
     def byte_order(self) -> ByteOrder:
         return self._byte_order
 
+    def reset(self) -> None:
+        """
+        Discard everything written so far and make the writer ready to
+        be reused. The underlying stream is rewound but not truncated, so
+        its buffer capacity is reused, and :attr:`bytes` only returns the
+        bytes written after the reset. Open checksum scopes are dropped.
+
+        """
+        self._stream.seek(0)
+        self._sz = 0
+        self._rewound = True
+        self._checksums.clear()
+
+    def _update_checksums(self, b: bytes_) -> None:
+        for checksum in self._checksums:
+            checksum.update(b)
+
+    def begin_checksum(self, algorithm: Checksum = Checksum.CRC32) -> None:
+        """
+        Open a checksum scope. Every byte written until the matching
+        :meth:`end_checksum` call is added to the running checksum.
+        Scopes can be nested.
+
+        :param algorithm: the checksum algorithm
+
+        """
+        self._checksums.append(RunningChecksum(algorithm))
+
+    def end_checksum(self) -> int:
+        """
+        Close the innermost checksum scope.
+
+        :returns: the checksum of the bytes written within the scope
+
+        :raises: RuntimeError: if there is no open checksum scope
+
+        """
+        if not self._checksums:
+            raise RuntimeError("There is no open checksum scope")
+
+        return self._checksums.pop().value
+
     def write_bool(self, b: bool) -> int:
         return self._write_val("?", bool(b))
 
@@ -94,7 +150,6 @@ class BinaryWriter:
         if i > 0:
             sz += self.write(bytes((i,)))
 
-        self._sz += sz
         return sz
 
     def write_zigzagint(self, i: int) -> int:
@@ -175,4 +230,7 @@ class BinaryWriter:
 
         self._sz += written
 
+        if self._checksums:
+            self._update_checksums(b)
+
         return written
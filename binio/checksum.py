@@ -0,0 +1,40 @@
+"""
+:mod:`binio.checksum` defines the running checksum used by
+the binary stream reader and writer
+
+"""
+
+import zlib
+from typing import Callable, Dict, Tuple
+
+from .enums import Checksum
+
+__all__ = ["RunningChecksum"]
+
+_ALGORITHMS: Dict[Checksum, Tuple[Callable[[bytes, int], int], int]] = {
+    Checksum.CRC32: (zlib.crc32, 0),
+    Checksum.ADLER32: (zlib.adler32, 1),
+}
+
+
+class RunningChecksum:
+    """
+    A checksum that is updated incrementally with every chunk of bytes.
+    """
+
+    __slots__ = ("_algorithm", "_func", "value")
+
+    def __init__(self, algorithm: Checksum = Checksum.CRC32) -> None:
+        try:
+            self._func, self.value = _ALGORITHMS[algorithm]
+        except KeyError:
+            raise ValueError(f"Unsupported checksum: {algorithm!r}") from None
+
+        self._algorithm = algorithm
+
+    @property
+    def algorithm(self) -> Checksum:
+        return self._algorithm
+
+    def update(self, b: bytes) -> None:
+        self.value = self._func(b, self.value)
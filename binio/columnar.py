@@ -0,0 +1,232 @@
+"""
+:mod:`binio.columnar` defines the columnar encoding of batches of
+homogeneous records
+
+Every field of the batch is written as a contiguous column, so a column
+is encoded and decoded with a single bulk operation instead of one call
+per record. The layout is the following (the integers are written in the
+byte order of the writer)::
+
+    header:  records (I) | fields (I) | fields x (name (nullstr) | type (B))
+    columns: column #0 | ... | column #fields-1
+
+A fixed-width column is an array of ``records`` values, a boolean column
+is an array of ``records`` bytes, a string column is an array of
+``records + 1`` offsets (I) followed by the concatenated encoded strings.
+
+"""
+
+import array
+import struct
+import sys
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+from .breader import BinaryReader
+from .bwriter import BinaryWriter
+from .enums import ByteOrder, ColumnType
+from .exceptions import InvalidFormat, OutOfRange
+
+__all__ = ["write_columns", "write_records", "read_columns"]
+
+Schema = Sequence[Tuple[str, ColumnType]]
+Column = Union["array.array[Any]", List[bool], List[str]]
+
+
+def _typecode(kind: str, size: int) -> str:
+    for typecode in kind:
+        if array.array(typecode).itemsize == size:
+            return typecode
+
+    raise RuntimeError(f"No array typecode for {size} bytes")
+
+
+_TYPECODES: Dict[ColumnType, str] = {
+    ColumnType.BOOL: "B",
+    ColumnType.INT8: "b",
+    ColumnType.UINT8: "B",
+    ColumnType.INT16: _typecode("hil", 2),
+    ColumnType.UINT16: _typecode("HIL", 2),
+    ColumnType.INT32: _typecode("ilq", 4),
+    ColumnType.UINT32: _typecode("ILQ", 4),
+    ColumnType.INT64: _typecode("lq", 8),
+    ColumnType.UINT64: _typecode("LQ", 8),
+    ColumnType.SINGLE: "f",
+    ColumnType.DOUBLE: "d",
+}
+
+_OFFSET_TYPECODE = _TYPECODES[ColumnType.UINT32]
+
+
+def _needs_swap(byte_order: ByteOrder) -> bool:
+    return (byte_order == ByteOrder.LITTLE) != (sys.byteorder == "little")
+
+
+def _array_bytes(byte_order: ByteOrder, arr: "array.array[Any]") -> bytes:
+    if _needs_swap(byte_order):
+        arr.byteswap()
+
+    return arr.tobytes()
+
+
+def _encode_column(
+    byte_order: ByteOrder,
+    column_type: ColumnType,
+    column: Sequence[Any],
+    encoding: str,
+) -> List[bytes]:
+    if column_type == ColumnType.STR:
+        blob = bytearray()
+        offsets = array.array(_OFFSET_TYPECODE, [0])
+        for s in column:
+            blob += s.encode(encoding)
+            offsets.append(len(blob))
+
+        return [_array_bytes(byte_order, offsets), bytes(blob)]
+
+    # unlike struct, array silently turns too big floats to infinity
+    if column_type == ColumnType.SINGLE:
+        fmt = "<" if byte_order == ByteOrder.LITTLE else ">"
+        return [struct.pack(f"{fmt}{len(column)}f", *column)]
+
+    if column_type == ColumnType.BOOL:
+        column = [bool(v) for v in column]
+
+    return [_array_bytes(byte_order, array.array(_TYPECODES[column_type], column))]
+
+
+def _read_array(reader: BinaryReader, typecode: str, n: int) -> "array.array[Any]":
+    arr = array.array(typecode)
+    arr.frombytes(reader.read(n * arr.itemsize))
+    if _needs_swap(reader.byte_order):
+        arr.byteswap()
+
+    return arr
+
+
+def write_columns(
+    writer: BinaryWriter,
+    schema: Schema,
+    columns: Mapping[str, Sequence[Any]],
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Write a batch given as a dict of columns.
+
+    :param writer: the writer to write the batch to
+    :param schema: the ``(name, type)`` pairs of the fields
+    :param columns: the values of every field, all the columns must
+    have the same length
+    :param encoding: the encoding of the string columns
+
+    :returns: the number of bytes written to the underlying storage
+
+    :raises: ValueError: if a field name is duplicated, a column is
+    missing or the columns have different lengths
+    :raises: ~binio.exceptions.OutOfRange: if a value cannot be serialized
+    to the requested format
+
+    """
+    if len({name for name, _ in schema}) != len(schema):
+        raise ValueError("The field names must be unique")
+
+    values = []
+    for name, _ in schema:
+        try:
+            values.append(columns[name])
+        except KeyError:
+            raise ValueError(f"Column {name!r} is missing") from None
+
+    n = len(values[0]) if values else 0
+    if any(len(column) != n for column in values):
+        raise ValueError("All the columns must have the same length")
+
+    # every column is encoded before anything is written, so a failed
+    # batch leaves the writer untouched
+    chunks = []
+    for (name, column_type), column in zip(schema, values):
+        try:
+            chunks += _encode_column(writer.byte_order, column_type, column, encoding)
+        except (AttributeError, OverflowError, TypeError, struct.error) as e:
+            raise OutOfRange(f"Column {name!r}: {e}") from e
+
+    sz = writer.write_uint32(n)
+    sz += writer.write_uint32(len(schema))
+    for name, column_type in schema:
+        sz += writer.write_nullstr(name, encoding)
+        sz += writer.write_uint8(column_type)
+
+    for chunk in chunks:
+        sz += writer.write(chunk)
+
+    return sz
+
+
+def write_records(
+    writer: BinaryWriter,
+    schema: Schema,
+    records: Sequence[Sequence[Any]],
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Write a batch given as a sequence of records. The values of
+    every record must follow the order of the schema fields.
+
+    See :func:`write_columns` for the parameters and exceptions.
+    """
+    if any(len(record) != len(schema) for record in records):
+        raise ValueError("Every record must have a value for every field")
+
+    transposed = zip(*records) if records else ([] for _ in schema)
+    columns = {name: column for (name, _), column in zip(schema, transposed)}
+
+    return write_columns(writer, schema, columns, encoding)
+
+
+def read_columns(reader: BinaryReader, encoding: str = "utf-8") -> Dict[str, Column]:
+    """
+    Read a batch written by :func:`write_columns` or :func:`write_records`.
+
+    :param reader: the reader to read the batch from
+    :param encoding: the encoding of the string columns
+
+    :returns: a dict of columns in the schema order; fixed-width columns
+    are :class:`array.array`, boolean and string columns are lists
+
+    :raises ~binio.exceptions.NotEnoughBytes: if the underlying
+    stream contains not enough bytes
+    :raises ~binio.exceptions.InvalidFormat: if the header or the string
+    offsets are corrupted
+
+    """
+    n = reader.read_uint32()
+    nfields = reader.read_uint32()
+
+    schema = []
+    for _ in range(nfields):
+        name = reader.read_nullstr(encoding)
+        try:
+            column_type = ColumnType(reader.read_uint8())
+        except ValueError as e:
+            raise InvalidFormat(e) from e
+        schema.append((name, column_type))
+
+    columns: Dict[str, Column] = {}
+    for name, column_type in schema:
+        if column_type == ColumnType.STR:
+            offsets = _read_array(reader, _OFFSET_TYPECODE, n + 1)
+            if offsets[0] != 0 or any(offsets[i] > offsets[i + 1] for i in range(n)):
+                raise InvalidFormat(f"Column {name!r} has corrupted offsets")
+
+            blob = reader.read(offsets[-1])
+            try:
+                columns[name] = [
+                    blob[offsets[i] : offsets[i + 1]].decode(encoding) for i in range(n)
+                ]
+            except UnicodeDecodeError as e:
+                raise InvalidFormat(f"Column {name!r}: {e}") from e
+        elif column_type == ColumnType.BOOL:
+            columns[name] = [b != 0 for b in reader.read(n)]
+        else:
+            columns[name] = _read_array(reader, _TYPECODES[column_type], n)
+
+    return columns
@@ -0,0 +1,482 @@
+"""
+:mod:`binio.compression` defines the block-compressed binary stream
+writer and reader
+
+The data is split into blocks of (at most) ``block_size`` uncompressed
+bytes and each block is compressed independently. The container layout
+is the following (all the integers are little endian)::
+
+    header:  magic (4s) | version (B) | compression (B) | block_size (I)
+    blocks:  compressed block #0 | ... | compressed block #N-1
+    index:   N entries of offset (Q) | compressed size (I) | size (I)
+    trailer: index offset (Q) | N (I) | magic (4s)
+
+Offsets are relative to the beginning of the container, which starts at
+the position of the stream when the writer or reader is created and
+ends at the end of the stream. The trailing index allows the reader to
+locate and decompress only the blocks that are actually touched.
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import bz2
+import io
+import lzma
+import struct
+import zlib
+from collections import OrderedDict
+from types import TracebackType
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from .breader import BinaryReader
+from .bwriter import BinaryWriter
+from .enums import ByteOrder, Compression
+from .exceptions import InvalidFormat, NotEnoughBytes
+
+__all__ = ["CompressedBinaryWriter", "CompressedBinaryReader"]
+
+# for stupid mypy...
+bytes_ = bytes
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_CACHE_SIZE = 8
+
+_MAGIC = b"BIOZ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+_INDEX_ENTRY = struct.Struct("<QII")
+_TRAILER = struct.Struct("<QI4s")
+
+_DECOMPRESSORS: Dict[Compression, Callable[[bytes_], bytes_]] = {
+    Compression.NONE: bytes_,
+    Compression.ZLIB: zlib.decompress,
+    Compression.LZMA: lzma.decompress,
+    Compression.BZ2: bz2.decompress,
+}
+
+
+def _tell(stream: BinaryIO) -> int:
+    try:
+        return stream.tell()
+    except OSError:
+        # not seekable streams cannot be reset anyway
+        return 0
+
+
+def _make_compressor(
+    compression: Compression, level: Optional[int]
+) -> Callable[[memoryview], bytes_]:
+    if compression == Compression.NONE:
+        return bytes_
+    if compression == Compression.ZLIB:
+        zlib_level = -1 if level is None else level
+        return lambda b: zlib.compress(b, zlib_level)
+    if compression == Compression.LZMA:
+        return lambda b: lzma.compress(b, preset=level)
+    if compression == Compression.BZ2:
+        bz2_level = 9 if level is None else level
+        return lambda b: bz2.compress(b, bz2_level)
+
+    raise ValueError(f"Unsupported compression: {compression!r}")
+
+
+class CompressedBinaryWriter(BinaryWriter):
+    """
+    A binary writer that compresses the written data block by block.
+
+    At most ``block_size`` uncompressed bytes are buffered in memory, full
+    blocks are compressed and written to the underlying stream as soon as
+    they are complete. :meth:`close` must be called to write the last
+    block and the block index.
+    """
+
+    def __init__(
+        self,
+        byte_order: Optional[ByteOrder],
+        compression: Compression = Compression.ZLIB,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        level: Optional[int] = None,
+    ) -> None:
+        super().__init__(byte_order)
+
+        if not 0 < block_size <= 0xFFFFFFFF:
+            raise ValueError("Argument block_size must be in range [1, 2**32)")
+
+        self._output: BinaryIO = self._stream
+        self._compression = Compression(compression)
+        self._compress = _make_compressor(self._compression, level)
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._index: List[Tuple[int, int, int]] = []
+        self._base = 0
+        self._offset = 0
+        self._closed = False
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: BinaryIO,
+        byte_order: Optional[ByteOrder],
+        compression: Compression = Compression.ZLIB,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        level: Optional[int] = None,
+    ) -> CompressedBinaryWriter:
+        writer = cls(byte_order, compression, block_size, level)
+        writer._output = stream
+        writer._base = _tell(stream)
+
+        return writer
+
+    def __enter__(self) -> CompressedBinaryWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def stream(self) -> BinaryIO:  # type: ignore[override]
+        return self._output
+
+    @property
+    def bytes(self) -> bytes_:
+        """
+        Return the compressed bytes written so far. Only supported
+        when the underlying stream is :class:`io.BytesIO`.
+
+        :return: bytes
+        """
+        if not isinstance(self._output, io.BytesIO):
+            raise io.UnsupportedOperation("The underlying stream is not io.BytesIO")
+
+        return self._output.getvalue()
+
+    @property
+    def compression(self) -> Compression:
+        return self._compression
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def reset(self) -> None:
+        """
+        Discard everything written so far, including the pending block,
+        and truncate the underlying stream to the beginning of the container.
+        Bytes that precede the container are kept.
+
+        """
+        self._output.seek(self._base)
+        self._output.truncate()
+        self._sz = 0
+        self._checksums.clear()
+        self._buffer.clear()
+        self._index.clear()
+        self._offset = 0
+        self._closed = False
+
+    def write(self, b: bytes_) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on a closed writer")
+
+        n = len(b)
+        block_size = self._block_size
+        start = 0
+        with memoryview(b) as view:
+            if self._buffer:
+                start = min(block_size - len(self._buffer), n)
+                self._buffer += view[:start]
+                if len(self._buffer) == block_size:
+                    self._write_pending_block()
+
+            while n - start >= block_size:
+                self._write_block(view[start : start + block_size])
+                start += block_size
+
+            self._buffer += view[start:]
+
+        self._sz += n
+
+        if self._checksums:
+            self._update_checksums(b)
+
+        return n
+
+    def flush(self) -> None:
+        """
+        Compress the buffered bytes as a (possibly short) block and
+        flush the underlying stream.
+
+        """
+        if self._closed:
+            raise ValueError("I/O operation on a closed writer")
+
+        if self._buffer:
+            self._write_pending_block()
+
+        self._output.flush()
+
+    def close(self) -> None:
+        """
+        Write the pending block, the block index and the trailer. The
+        underlying stream is left open.
+
+        """
+        if self._closed:
+            return
+
+        self.flush()
+
+        index = b"".join(_INDEX_ENTRY.pack(*entry) for entry in self._index)
+        index_offset = self._write_raw(index)
+        self._write_raw(_TRAILER.pack(index_offset, len(self._index), _MAGIC))
+
+        self._output.flush()
+        self._closed = True
+
+    def _write_pending_block(self) -> None:
+        with memoryview(self._buffer) as view:
+            self._write_block(view)
+
+        self._buffer.clear()
+
+    def _write_block(self, data: memoryview) -> None:
+        compressed = self._compress(data)
+        offset = self._write_raw(compressed)
+        self._index.append((offset, len(compressed), len(data)))
+
+    def _write_raw(self, b: bytes_) -> int:
+        if self._offset == 0:
+            header = _HEADER.pack(_MAGIC, _VERSION, self._compression, self._block_size)
+            self._output.write(header)
+            self._offset += len(header)
+
+        offset = self._offset
+        self._output.write(b)
+        self._offset += len(b)
+
+        return offset
+
+
+class CompressedBinaryReader(BinaryReader):
+    """
+    A binary reader over the data produced by :class:`CompressedBinaryWriter`.
+    The container is read from the current position of the given stream
+    to its end.
+
+    Blocks are decompressed lazily, only when they are touched, and the
+    last ``cache_size`` decompressed blocks are kept in a LRU cache, so
+    random access via :meth:`seek` stays cheap.
+    """
+
+    def __init__(
+        self,
+        b: Union[BinaryIO, bytes_],
+        byte_order: Optional[ByteOrder] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        super().__init__(b"", byte_order)
+
+        if cache_size < 1:
+            raise ValueError("Argument cache_size must be positive")
+
+        self._cache: OrderedDict[int, bytes_] = OrderedDict()
+        self._cache_size = cache_size
+        self.reset(b)
+
+    @property
+    def stream(self) -> BinaryIO:  # type: ignore[override]
+        return self._source
+
+    @property
+    def bytes(self) -> bytes_:
+        """
+        Return bytes containing the entire decompressed contents.
+        The blocks are not put to the cache.
+
+        :return: bytes
+        """
+        return b"".join(self._decompress_block(i) for i in range(len(self._offsets)))
+
+    @property
+    def compression(self) -> Compression:
+        return self._compression
+
+    @property
+    def size(self) -> int:
+        """
+        Return the total number of the uncompressed bytes
+
+        """
+        return self._size
+
+    def reset(self, b: Union[BinaryIO, bytes_]) -> None:
+        """
+        Make the reader ready to read the given compressed stream keeping
+        the byte order and the cache capacity.
+
+        :param b: the new compressed stream to read
+
+        :raises ~binio.exceptions.InvalidFormat: if the given stream is
+        not a valid compressed stream
+
+        """
+        self._source: BinaryIO = io.BytesIO(b) if isinstance(b, bytes_) else b
+        self._cache.clear()
+        self._checksums.clear()
+        self._pos = 0
+
+        self._block_data = b""
+        self._block_start = 0
+        self._block_end = 0
+
+        self._read_index()
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Change the position in the uncompressed data.
+
+        :param offset: the offset relative to the position indicated by whence
+        :param whence: one of :data:`io.SEEK_SET`, :data:`io.SEEK_CUR` or
+        :data:`io.SEEK_END`
+
+        :returns: the new absolute position
+        """
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence!r}")
+
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+
+        self._pos = pos
+
+        return pos
+
+    def _read_index(self) -> None:
+        src = self._source
+        base = src.tell()
+        total = src.seek(0, io.SEEK_END) - base
+        if total < _HEADER.size + _TRAILER.size:
+            raise InvalidFormat("The stream is too short to be a compressed stream")
+
+        src.seek(base)
+        magic, version, compression, block_size = _HEADER.unpack(src.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise InvalidFormat("Bad magic number in the header")
+        if version != _VERSION:
+            raise InvalidFormat(f"Unsupported version: {version}")
+        try:
+            self._compression = Compression(compression)
+        except ValueError as e:
+            raise InvalidFormat(e) from e
+
+        src.seek(base + total - _TRAILER.size)
+        index_offset, count, magic = _TRAILER.unpack(src.read(_TRAILER.size))
+        if magic != _MAGIC:
+            raise InvalidFormat("Bad magic number in the trailer")
+        if index_offset + count * _INDEX_ENTRY.size != total - _TRAILER.size:
+            raise InvalidFormat("The block index is corrupted")
+
+        src.seek(base + index_offset)
+        index = src.read(count * _INDEX_ENTRY.size)
+
+        self._decompress = _DECOMPRESSORS[self._compression]
+        self._offsets: List[int] = []
+        self._csizes: List[int] = []
+        self._usizes: List[int] = []
+        self._starts: List[int] = []
+
+        start = 0
+        for offset, csize, usize in _INDEX_ENTRY.iter_unpack(index):
+            self._offsets.append(base + offset)
+            self._csizes.append(csize)
+            self._usizes.append(usize)
+            self._starts.append(start)
+            start += usize
+
+        self._size = start
+
+    def _decompress_block(self, i: int) -> bytes_:
+        self._source.seek(self._offsets[i])
+        raw = self._source.read(self._csizes[i])
+        if len(raw) != self._csizes[i]:
+            raise InvalidFormat(f"Block #{i} is truncated")
+
+        try:
+            data = self._decompress(raw)
+        except (zlib.error, lzma.LZMAError, OSError, ValueError) as e:
+            raise InvalidFormat(e) from e
+
+        if len(data) != self._usizes[i]:
+            raise InvalidFormat(f"Block #{i} has unexpected size")
+
+        return data
+
+    def _load_block(self, i: int) -> bytes_:
+        data = self._cache.get(i)
+        if data is None:
+            data = self._decompress_block(i)
+            self._cache[i] = data
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(i)
+
+        self._block_data = data
+        self._block_start = self._starts[i]
+        self._block_end = self._block_start + len(data)
+
+        return data
+
+    def _ensure_bytes(self, n: Optional[int] = None) -> bytes_:
+        pos = self._pos
+        available = max(self._size - pos, 0)
+        if n is None:
+            n = available
+        elif n > available:
+            raise NotEnoughBytes(
+                f"Not enough bytes to read. Asked {n} bytes, "
+                f"available {available} bytes."
+            )
+
+        end = pos + n
+        self._pos = end
+
+        if self._block_start <= pos and end <= self._block_end:
+            start = pos - self._block_start
+            b = self._block_data[start : start + n]
+        else:
+            chunks = []
+            while pos < end:
+                i = bisect.bisect_right(self._starts, pos) - 1
+                data = self._load_block(i)
+                start = pos - self._block_start
+                chunk = data[start : start + end - pos]
+                chunks.append(chunk)
+                pos += len(chunk)
+
+            b = b"".join(chunks)
+
+        if self._checksums:
+            self._update_checksums(b)
+
+        return b
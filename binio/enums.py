@@ -5,10 +5,37 @@
 
 from enum import IntEnum, auto
 
-__all__ = ["ByteOrder"]
+__all__ = ["ByteOrder", "Compression", "Checksum", "ColumnType"]
 
 
 class ByteOrder(IntEnum):
     MACHINE = auto()
     BIG = auto()
     LITTLE = auto()
+
+
+class Compression(IntEnum):
+    NONE = auto()
+    ZLIB = auto()
+    LZMA = auto()
+    BZ2 = auto()
+
+
+class Checksum(IntEnum):
+    CRC32 = auto()
+    ADLER32 = auto()
+
+
+class ColumnType(IntEnum):
+    BOOL = auto()
+    INT8 = auto()
+    UINT8 = auto()
+    INT16 = auto()
+    UINT16 = auto()
+    INT32 = auto()
+    UINT32 = auto()
+    INT64 = auto()
+    UINT64 = auto()
+    SINGLE = auto()
+    DOUBLE = auto()
+    STR = auto()
@@ -4,6 +4,7 @@
 * :exc: `BinIOException`
     * :exc: `NotEnoughBytes`
     * :exc: `OutOfRange`
+    * :exc: `InvalidFormat`
 
 """
 
@@ -11,6 +12,7 @@ __all__ = [
     "BinIOException",
     "NotEnoughBytes",
     "OutOfRange",
+    "InvalidFormat",
 ]
 
 
@@ -34,3 +36,11 @@ class OutOfRange(BinIOException):
     to the requested format.
 
     """
+
+
+class InvalidFormat(BinIOException):
+    """
+    Raised when the underlying data does not follow
+    the expected container format.
+
+    """
@@ -0,0 +1,189 @@
+"""
+:mod:`binio.instrument` defines the opt-in instrumentation of the binary
+stream readers and writers
+
+An instrumented object counts calls, bytes and the cumulative time
+per ``read*``/``write*`` method. The instrumentation is enabled by
+swapping the class of the object with a generated subclass, so objects
+that are not instrumented run the original code without any checks.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .breader import BinaryReader
+from .bwriter import BinaryWriter
+
+__all__ = ["Instrumentation", "MethodStats", "instrument", "uninstrument"]
+
+T = TypeVar("T", BinaryReader, BinaryWriter)
+
+#: ``hook(method, offset, size)`` called after every instrumented call
+Hook = Callable[[str, int, int], None]
+
+_INSTRUMENTED: Dict[type, type] = {}
+
+
+class MethodStats:
+    """
+    Counters of a single method.
+    """
+
+    __slots__ = ("calls", "bytes", "time_ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        self.time_ns = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"calls": self.calls, "bytes": self.bytes, "time_ns": self.time_ns}
+
+
+class Instrumentation:
+    """
+    Per-method counters shared by one or more instrumented objects.
+
+    Only the outermost calls are accounted, e.g. :meth:`write_nullstr`
+    is not accounted as :meth:`write` plus :meth:`write_int8`. The counters
+    are not thread-safe.
+
+    :param hook: an optional callback ``hook(method, offset, size)`` called
+    after every accounted call, where ``offset`` is the position of the
+    object before the call (:meth:`tell` for readers, :attr:`size` for
+    writers) and ``size`` is the number of bytes processed by the call
+    """
+
+    def __init__(self, hook: Optional[Hook] = None) -> None:
+        self.hook = hook
+        self._stats: Dict[str, MethodStats] = {}
+
+    def __getitem__(self, method: str) -> MethodStats:
+        return self._stats[method]
+
+    def record(self, method: str, offset: int, size: int, time_ns: int) -> None:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = MethodStats()
+
+        stats.calls += 1
+        stats.bytes += size
+        stats.time_ns += time_ns
+
+        if self.hook is not None:
+            self.hook(method, offset, size)
+
+    def clear(self) -> None:
+        self._stats.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """
+        Export the counters as a dict suitable for a metrics pipeline:
+        ``{"read_uint32": {"calls": 1, "bytes": 4, "time_ns": 1200}, ...}``
+
+        """
+        return {method: stats.as_dict() for method, stats in self._stats.items()}
+
+
+def _wrap(
+    name: str, func: Callable[..., Any], position: Callable[[Any], int]
+) -> Callable[..., Any]:
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._instr_depth:
+            return func(self, *args, **kwargs)
+
+        offset = position(self)
+        self._instr_depth = 1
+        start = perf_counter_ns()
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            self._instr_depth = 0
+
+        elapsed = perf_counter_ns() - start
+        size = position(self) - offset
+        self._instrumentation.record(name, offset, size, elapsed)
+
+        return result
+
+    return wrapper
+
+
+def _reader_position(reader: BinaryReader) -> int:
+    return reader.tell()
+
+
+def _writer_position(writer: BinaryWriter) -> int:
+    return writer.size
+
+
+def _instrumented_class(cls: type) -> type:
+    try:
+        return _INSTRUMENTED[cls]
+    except KeyError:
+        pass
+
+    position: Callable[[Any], int]
+    if issubclass(cls, BinaryReader):
+        prefix, position = "read", _reader_position
+    elif issubclass(cls, BinaryWriter):
+        prefix, position = "write", _writer_position
+    else:
+        raise TypeError(f"Cannot instrument {cls.__name__}")
+
+    namespace: Dict[str, Any] = {}
+    for name in dir(cls):
+        if not name.startswith(prefix):
+            continue
+
+        func = getattr(cls, name)
+        if callable(func):
+            namespace[name] = _wrap(name, func, position)
+
+    instrumented = _INSTRUMENTED[cls] = type(
+        f"Instrumented{cls.__name__}", (cls,), namespace
+    )
+
+    return instrumented
+
+
+def instrument(obj: T, instrumentation: Instrumentation) -> T:
+    """
+    Enable the instrumentation of the given reader or writer. Calling it
+    on an instrumented object just replaces its counters.
+
+    :param obj: the reader or writer to be instrumented
+    :param instrumentation: the counters to update
+
+    :returns: the same object, now instrumented
+    """
+    cls = type(obj)
+    if cls not in _INSTRUMENTED.values():
+        setattr(obj, "__class__", _instrumented_class(cls))
+        setattr(obj, "_instr_depth", 0)
+
+    setattr(obj, "_instrumentation", instrumentation)
+
+    return obj
+
+
+def uninstrument(obj: T) -> T:
+    """
+    Disable the instrumentation of the given reader or writer.
+
+    :returns: the same object with the original class restored
+    """
+    cls = type(obj)
+    if cls in _INSTRUMENTED.values():
+        setattr(obj, "__class__", cls.__bases__[0])
+        for name in ("_instr_depth", "_instrumentation"):
+            delattr(obj, name)
+
+    return obj
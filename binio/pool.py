@@ -0,0 +1,135 @@
+"""
+:mod:`binio.pool` defines the pool of reusable binary stream writers
+
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from .bwriter import BinaryWriter
+from .enums import ByteOrder
+from .instrument import uninstrument
+
+__all__ = ["WriterPool"]
+
+
+class WriterPool:
+    """
+    A pool of :class:`~binio.bwriter.BinaryWriter` objects.
+
+    Every thread has its own free list of writers. The free list of
+    a thread is filled with ``prewarm`` writers the first time the thread
+    uses the pool. Writers keep their buffer capacity between uses, those
+    whose buffer grew larger than ``max_buffer_size`` bytes are not
+    retained, so a single huge message does not pin its memory in the pool.
+    """
+
+    def __init__(
+        self,
+        byte_order: Optional[ByteOrder],
+        max_free: int = 16,
+        max_buffer_size: int = 64 * 1024,
+        prewarm: int = 0,
+    ) -> None:
+        if byte_order is None:
+            byte_order = ByteOrder.BIG if sys.byteorder == "big" else ByteOrder.LITTLE
+
+        self._byte_order = byte_order
+        self._max_free = max_free
+        self._max_buffer_size = max_buffer_size
+        self._prewarm = min(prewarm, max_free)
+        self._local = threading.local()
+        # the writers released and not acquired since, whichever thread
+        # holds them, guarded by the lock
+        self._released: weakref.WeakSet[BinaryWriter] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def byte_order(self) -> ByteOrder:
+        return self._byte_order
+
+    @property
+    def free(self) -> int:
+        """
+        Return the number of writers retained for the current thread
+
+        """
+        return len(self._free_list())
+
+    def _free_list(self) -> List[BinaryWriter]:
+        try:
+            free: List[BinaryWriter] = self._local.free
+        except AttributeError:
+            free = self._local.free = [
+                BinaryWriter(self._byte_order) for _ in range(self._prewarm)
+            ]
+            with self._lock:
+                self._released.update(free)
+
+        return free
+
+    def acquire(self) -> BinaryWriter:
+        """
+        Take a writer from the current thread's free list or create
+        a new one if the list is empty.
+
+        :returns: an empty binary writer
+        """
+        free = self._free_list()
+        if free:
+            writer = free.pop()
+            with self._lock:
+                self._released.discard(writer)
+            return writer
+
+        return BinaryWriter(self._byte_order)
+
+    def release(self, writer: BinaryWriter) -> None:
+        """
+        Reset the writer and return it to the current thread's free list.
+        The writer must not be used after it is released. An instrumented
+        writer is uninstrumented, so it does not report to the old counters
+        once it is acquired again.
+
+        :param writer: the writer previously returned by :meth:`acquire`
+
+        :raises: ValueError: if the writer byte order differs from the
+        pool one or the writer is already released, by any thread
+
+        """
+        if writer.byte_order != self._byte_order:
+            raise ValueError("The writer byte order differs from the pool one")
+
+        with self._lock:
+            if writer in self._released:
+                raise ValueError("The writer is already released")
+            self._released.add(writer)
+
+        free = self._free_list()
+        if len(free) >= self._max_free:
+            return
+
+        with writer.stream.getbuffer() as view:
+            if len(view) > self._max_buffer_size:
+                return
+
+        uninstrument(writer)
+        writer.reset()
+        free.append(writer)
+
+    @contextmanager
+    def writer(self) -> Iterator[BinaryWriter]:
+        """
+        Acquire a writer for the duration of the ``with`` block.
+
+        """
+        writer = self.acquire()
+        try:
+            yield writer
+        finally:
+            self.release(writer)
@@ -17,7 +17,7 @@ setup(
     url=__URL__,
     author=__AUTHOR__,
     author_email=__AUTHOR_EMAIL__,
-    packages=find_packages(exclude=["tests*"]),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     package_data={"binio": ["py.typed"]},
     zip_safe=True,
     license=__LICENSE__,
@@ -1,6 +1,7 @@
 import unittest
+import zlib
 
-from binio import BinaryReader, ByteOrder
+from binio import BinaryReader, ByteOrder, Checksum
 
 
 class BinaryReaderTests(unittest.TestCase):
@@ -159,3 +160,26 @@ class BinaryReaderTests(unittest.TestCase):
 
         self.assertEqual(reader.read(2), b"\xfa\x00")
         self.assertEqual(reader.read(), b"\x80")
+
+    def test_checksum(self) -> None:
+        reader = BinaryReader(b"\x2a\x00\x00\x00Hello\x00", ByteOrder.LITTLE)
+
+        reader.begin_checksum()
+        reader.read_uint32()
+        reader.begin_checksum(Checksum.ADLER32)
+        reader.read_nullstr()
+
+        self.assertEqual(reader.end_checksum(), zlib.adler32(b"Hello\x00"))
+        self.assertEqual(reader.end_checksum(), zlib.crc32(reader.bytes))
+
+        with self.assertRaises(RuntimeError):
+            reader.end_checksum()
+
+    def test_reset(self) -> None:
+        reader = BinaryReader(b"\x01", ByteOrder.BIG)
+
+        reader.read_uint8()
+        reader.reset(b"\x00\x80")
+
+        self.assertEqual(reader.byte_order, ByteOrder.BIG)
+        self.assertEqual(reader.read_uint16(), 128)
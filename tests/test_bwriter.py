@@ -1,7 +1,8 @@
 import io
 import unittest
+import zlib
 
-from binio import BinaryWriter, ByteOrder
+from binio import BinaryWriter, ByteOrder, Checksum
 
 
 class BinaryWriterTests(unittest.TestCase):
@@ -13,6 +14,8 @@ class BinaryWriterTests(unittest.TestCase):
         self.assertEqual(writer.size, 1)
         writer.write_int16(3456)
         self.assertEqual(writer.size, 3)
+        writer.write_uleb128(300)
+        self.assertEqual(writer.size, 5)
 
     def test_uleb128(self) -> None:
         writer = BinaryWriter(ByteOrder.LITTLE)
@@ -188,3 +191,35 @@ class BinaryWriterTests(unittest.TestCase):
         self.assertEqual(writer.bytes, b"\x80")
         writer.write(b"\xfa\x00")
         self.assertEqual(writer.bytes, b"\x80\xfa\x00")
+
+    def test_checksum(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+
+        writer.begin_checksum()
+        writer.write_uint32(42)
+        writer.begin_checksum(Checksum.ADLER32)
+        writer.write_nullstr("Hello")
+        adler = writer.end_checksum()
+        crc = writer.end_checksum()
+
+        self.assertEqual(adler, zlib.adler32(b"Hello\x00"))
+        self.assertEqual(crc, zlib.crc32(writer.bytes))
+
+        with self.assertRaises(RuntimeError):
+            writer.end_checksum()
+
+    def test_reset(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+        stream = writer.stream
+
+        writer.write_uint32(1)
+        writer.begin_checksum()
+        writer.reset()
+
+        self.assertIs(writer.stream, stream)
+        self.assertEqual(writer.size, 0)
+        self.assertEqual(writer.bytes, b"")
+        writer.write_uint8(2)
+        self.assertEqual(writer.bytes, b"\x02")
+        with self.assertRaises(RuntimeError):
+            writer.end_checksum()
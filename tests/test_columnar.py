@@ -0,0 +1,144 @@
+import array
+import unittest
+
+from binio import (
+    BinaryReader,
+    BinaryWriter,
+    ByteOrder,
+    ColumnType,
+    read_columns,
+    write_columns,
+    write_records,
+)
+from binio.exceptions import InvalidFormat, OutOfRange
+
+SCHEMA = [
+    ("id", ColumnType.UINT32),
+    ("price", ColumnType.DOUBLE),
+    ("delta", ColumnType.INT16),
+    ("active", ColumnType.BOOL),
+    ("name", ColumnType.STR),
+]
+
+RECORDS = [
+    (1, 9.5, -3, True, "apple"),
+    (2, 0.25, 300, False, ""),
+    (3, -1.0, -32768, True, "груша"),
+]
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        for byte_order in (ByteOrder.LITTLE, ByteOrder.BIG):
+            with self.subTest(byte_order=byte_order):
+                writer = BinaryWriter(byte_order)
+                sz = write_records(writer, SCHEMA, RECORDS)
+                self.assertEqual(sz, len(writer.bytes))
+
+                columns = read_columns(BinaryReader(writer.bytes, byte_order))
+                self.assertEqual(list(columns), [name for name, _ in SCHEMA])
+                self.assertEqual(columns["id"], array.array("I", [1, 2, 3]))
+                self.assertEqual(list(columns["price"]), [9.5, 0.25, -1.0])
+                self.assertEqual(list(columns["delta"]), [-3, 300, -32768])
+                self.assertEqual(columns["active"], [True, False, True])
+                self.assertEqual(columns["name"], ["apple", "", "груша"])
+
+    def test_layout(self) -> None:
+        writer = BinaryWriter(ByteOrder.BIG)
+
+        write_columns(writer, [("v", ColumnType.UINT16)], {"v": [1, 2]})
+
+        self.assertEqual(
+            writer.bytes,
+            b"\x00\x00\x00\x02\x00\x00\x00\x01v\x00\x05\x00\x01\x00\x02",
+        )
+
+    def test_records_equal_columns(self) -> None:
+        records = BinaryWriter(ByteOrder.LITTLE)
+        columns = BinaryWriter(ByteOrder.LITTLE)
+
+        write_records(records, SCHEMA, RECORDS)
+        write_columns(
+            columns,
+            SCHEMA,
+            {name: [r[i] for r in RECORDS] for i, (name, _) in enumerate(SCHEMA)},
+        )
+
+        self.assertEqual(records.bytes, columns.bytes)
+
+    def test_empty(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+
+        write_records(writer, SCHEMA, [])
+        columns = read_columns(BinaryReader(writer.bytes, ByteOrder.LITTLE))
+
+        self.assertEqual(columns["name"], [])
+        self.assertEqual(len(columns["id"]), 0)
+
+    def test_errors(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+
+        with self.assertRaises(ValueError):
+            write_columns(writer, SCHEMA, {"id": [1]})
+        with self.assertRaises(ValueError):
+            write_columns(
+                writer,
+                [("a", ColumnType.INT8), ("b", ColumnType.INT8)],
+                {"a": [1], "b": [1, 2]},
+            )
+        with self.assertRaises(OutOfRange):
+            write_columns(writer, [("a", ColumnType.INT8)], {"a": [128]})
+        with self.assertRaises(OutOfRange):
+            write_columns(writer, [("f", ColumnType.SINGLE)], {"f": [1e300]})
+        with self.assertRaises(OutOfRange):
+            write_columns(writer, [("s", ColumnType.STR)], {"s": [1]})
+
+    def test_single_inf(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+
+        write_columns(writer, [("f", ColumnType.SINGLE)], {"f": [float("inf")]})
+        columns = read_columns(BinaryReader(writer.bytes, ByteOrder.LITTLE))
+
+        self.assertEqual(list(columns["f"]), [float("inf")])
+
+    def test_single(self) -> None:
+        for byte_order in (ByteOrder.LITTLE, ByteOrder.BIG):
+            with self.subTest(byte_order=byte_order):
+                writer = BinaryWriter(byte_order)
+                write_columns(writer, [("f", ColumnType.SINGLE)], {"f": [0.5, -2]})
+                columns = read_columns(BinaryReader(writer.bytes, byte_order))
+
+                self.assertEqual(list(columns["f"]), [0.5, -2.0])
+
+    def test_duplicate_names(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+        schema = [("a", ColumnType.INT8), ("a", ColumnType.STR)]
+
+        with self.assertRaises(ValueError):
+            write_columns(writer, schema, {"a": [1]})
+        with self.assertRaises(ValueError):
+            write_records(writer, schema, [(1, "x")])
+
+    def test_no_partial_write(self) -> None:
+        writer = BinaryWriter(ByteOrder.LITTLE)
+
+        with self.assertRaises(OutOfRange):
+            write_records(writer, SCHEMA, [(1, 9.5, 40000, True, "apple")])
+
+        self.assertEqual(writer.size, 0)
+        self.assertEqual(writer.bytes, b"")
+
+    def test_corrupted_offsets(self) -> None:
+        header = b"\x02\x00\x00\x00\x01\x00\x00\x00s\x00\x0c"
+
+        for offsets in ((1, 2, 2), (0, 2, 1)):
+            with self.subTest(offsets=offsets):
+                data = header + b"".join(o.to_bytes(4, "little") for o in offsets)
+                reader = BinaryReader(data + b"ab", ByteOrder.LITTLE)
+                with self.assertRaises(InvalidFormat):
+                    read_columns(reader)
+
+        data = header + b"\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00"
+        reader = BinaryReader(data + b"\xff\xfe", ByteOrder.LITTLE)
+        with self.assertRaises(InvalidFormat):
+            read_columns(reader)
@@ -0,0 +1,185 @@
+import io
+import unittest
+import zlib
+
+from binio import (
+    ByteOrder,
+    CompressedBinaryReader,
+    CompressedBinaryWriter,
+    Compression,
+)
+from binio.exceptions import InvalidFormat, NotEnoughBytes
+
+
+class CompressedBinaryWriterTests(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        for compression in Compression:
+            with self.subTest(compression=compression):
+                writer = CompressedBinaryWriter(
+                    ByteOrder.LITTLE, compression, block_size=16
+                )
+                for i in range(100):
+                    writer.write_uint32(i)
+                    writer.write_nullstr("Hello")
+                writer.close()
+
+                reader = CompressedBinaryReader(writer.bytes, ByteOrder.LITTLE)
+                self.assertEqual(reader.compression, compression)
+                for i in range(100):
+                    self.assertEqual(reader.read_uint32(), i)
+                    self.assertEqual(reader.read_nullstr(), "Hello")
+                self.assertEqual(reader.read(), b"")
+
+    def test_bounded_buffer(self) -> None:
+        stream = io.BytesIO()
+        writer = CompressedBinaryWriter.from_stream(
+            stream, ByteOrder.LITTLE, block_size=8
+        )
+
+        writer.write(b"\x01" * 20)
+        self.assertEqual(len(writer._buffer), 4)
+        self.assertGreater(len(stream.getvalue()), 0)
+        self.assertEqual(writer.size, 20)
+
+    def test_large_write(self) -> None:
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE, block_size=8)
+
+        writer.write(b"abc")
+        writer.write(bytes(range(20)))
+        self.assertEqual(len(writer._buffer), 7)
+        self.assertEqual([entry[2] for entry in writer._index], [8, 8])
+        writer.close()
+
+        reader = CompressedBinaryReader(writer.bytes)
+        self.assertEqual(reader.read(), b"abc" + bytes(range(20)))
+
+    def test_empty(self) -> None:
+        with CompressedBinaryWriter(ByteOrder.LITTLE) as writer:
+            pass
+
+        reader = CompressedBinaryReader(writer.bytes)
+        self.assertEqual(reader.size, 0)
+        self.assertEqual(reader.read(), b"")
+
+    def test_closed(self) -> None:
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE)
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        with self.assertRaises(ValueError):
+            writer.write_uint8(1)
+
+    def test_reset(self) -> None:
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE, block_size=4)
+
+        writer.write(b"garbage")
+        writer.close()
+        reader = CompressedBinaryReader(writer.bytes)
+
+        writer.reset()
+        writer.write(b"abc")
+        writer.close()
+
+        self.assertEqual(reader.read(3), b"gar")
+        reader.reset(writer.bytes)
+        self.assertEqual(reader.read(), b"abc")
+
+    def test_prefix(self) -> None:
+        stream = io.BytesIO()
+        stream.write(b"prefix")
+        writer = CompressedBinaryWriter.from_stream(
+            stream, ByteOrder.LITTLE, block_size=4
+        )
+
+        writer.write(b"garbage")
+        writer.reset()
+        writer.write(b"0123456789")
+        writer.close()
+        self.assertTrue(stream.getvalue().startswith(b"prefix"))
+
+        stream.seek(6)
+        reader = CompressedBinaryReader(stream)
+        reader.seek(4)
+        self.assertEqual(reader.read(), b"456789")
+
+    def test_flush(self) -> None:
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE, block_size=16)
+
+        writer.write(b"abc")
+        writer.flush()
+        writer.write(b"def")
+        writer.close()
+
+        reader = CompressedBinaryReader(writer.bytes)
+        self.assertEqual(reader.read(), b"abcdef")
+
+
+class CompressedBinaryReaderTests(unittest.TestCase):
+    def _archive(self) -> bytes:
+        writer = CompressedBinaryWriter(ByteOrder.BIG, block_size=10)
+        for i in range(100):
+            writer.write_uint16(i)
+        writer.close()
+
+        return writer.bytes
+
+    def test_seek(self) -> None:
+        reader = CompressedBinaryReader(io.BytesIO(self._archive()), ByteOrder.BIG)
+
+        self.assertEqual(reader.size, 200)
+        reader.seek(150)
+        self.assertEqual(reader.read_uint16(), 75)
+        reader.seek(9)
+        self.assertEqual(reader.read(2), b"\x04\x00")
+        self.assertEqual(reader.tell(), 11)
+        reader.seek(-2, io.SEEK_END)
+        self.assertEqual(reader.read_uint16(), 99)
+
+    def test_cache(self) -> None:
+        reader = CompressedBinaryReader(self._archive(), ByteOrder.BIG, cache_size=2)
+
+        reader.seek(0)
+        reader.read_uint16()
+        reader.seek(50)
+        reader.read_uint16()
+        reader.seek(100)
+        reader.read_uint16()
+        self.assertEqual(list(reader._cache), [5, 10])
+
+    def test_bytes(self) -> None:
+        reader = CompressedBinaryReader(self._archive(), ByteOrder.BIG)
+
+        self.assertEqual(
+            reader.bytes, b"".join(i.to_bytes(2, "big") for i in range(100))
+        )
+
+    def test_not_enough_bytes(self) -> None:
+        reader = CompressedBinaryReader(self._archive(), ByteOrder.BIG)
+
+        reader.seek(199)
+        with self.assertRaises(NotEnoughBytes):
+            reader.read_uint16()
+
+    def test_checksum(self) -> None:
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE, block_size=4)
+        writer.begin_checksum()
+        writer.write(b"0123456789")
+        writer.write_uint32(writer.end_checksum())
+        writer.close()
+
+        reader = CompressedBinaryReader(writer.bytes, ByteOrder.LITTLE)
+        reader.begin_checksum()
+        self.assertEqual(reader.read(10), b"0123456789")
+        crc = reader.end_checksum()
+        self.assertEqual(crc, zlib.crc32(b"0123456789"))
+        self.assertEqual(reader.read_uint32(), crc)
+
+    def test_invalid_format(self) -> None:
+        with self.assertRaises(InvalidFormat):
+            CompressedBinaryReader(b"\x00" * 32)
+
+        archive = bytearray(self._archive())
+        archive[len(archive) // 2] ^= 0xFF
+        reader = CompressedBinaryReader(bytes(archive))
+        with self.assertRaises(InvalidFormat):
+            reader.read()
@@ -0,0 +1,141 @@
+import unittest
+from typing import List, Tuple
+
+from binio import (
+    BinaryReader,
+    BinaryWriter,
+    ByteOrder,
+    CompressedBinaryReader,
+    CompressedBinaryWriter,
+    Instrumentation,
+    WriterPool,
+    instrument,
+    uninstrument,
+)
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_writer(self) -> None:
+        instrumentation = Instrumentation()
+        writer = instrument(BinaryWriter(ByteOrder.LITTLE), instrumentation)
+
+        writer.write_uint32(1)
+        writer.write_uint32(2)
+        writer.write_nullstr("Hello")
+        writer.write_uleb128(300)
+
+        self.assertIsInstance(writer, BinaryWriter)
+        self.assertEqual(
+            {
+                method: (stats["calls"], stats["bytes"])
+                for method, stats in instrumentation.as_dict().items()
+            },
+            {
+                "write_uint32": (2, 8),
+                "write_nullstr": (1, 6),
+                "write_uleb128": (1, 2),
+            },
+        )
+        self.assertGreaterEqual(instrumentation["write_uint32"].time_ns, 0)
+
+    def test_reader(self) -> None:
+        instrumentation = Instrumentation()
+        reader = instrument(
+            BinaryReader(b"\x01\x00Hello\x00\xac\x02", ByteOrder.LITTLE),
+            instrumentation,
+        )
+
+        self.assertEqual(reader.read_uint16(), 1)
+        self.assertEqual(reader.read_nullstr(), "Hello")
+        self.assertEqual(reader.read_uleb128(), 300)
+
+        self.assertEqual(instrumentation["read_uint16"].bytes, 2)
+        self.assertEqual(instrumentation["read_nullstr"].bytes, 6)
+        self.assertEqual(instrumentation["read_uleb128"].calls, 1)
+        self.assertNotIn("read_int8", instrumentation.as_dict())
+
+    def test_hook(self) -> None:
+        calls: List[Tuple[str, int, int]] = []
+        instrumentation = Instrumentation(
+            lambda method, offset, size: calls.append((method, offset, size))
+        )
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE)
+        instrument(writer, instrumentation)
+
+        writer.write_uint8(1)
+        writer.write_double(1.0)
+        writer.close()
+
+        reader = CompressedBinaryReader(writer.bytes, ByteOrder.LITTLE)
+        instrument(reader, instrumentation)
+        reader.read_uint8()
+        reader.read_double()
+
+        self.assertEqual(
+            calls,
+            [
+                ("write_uint8", 0, 1),
+                ("write_double", 1, 8),
+                ("read_uint8", 0, 1),
+                ("read_double", 1, 8),
+            ],
+        )
+
+    def test_hook_offset_after_reset(self) -> None:
+        offsets: List[int] = []
+        instrumentation = Instrumentation(
+            lambda method, offset, size: offsets.append(offset)
+        )
+        writer = instrument(BinaryWriter(ByteOrder.LITTLE), instrumentation)
+        reader = instrument(
+            BinaryReader(b"\x01\x00", ByteOrder.LITTLE), instrumentation
+        )
+
+        writer.write_uint32(1)
+        writer.reset()
+        writer.write_uint32(2)
+        reader.read_uint8()
+        reader.reset(b"\x02\x00")
+        reader.read_uint8()
+
+        self.assertEqual(offsets, [0, 0, 0, 0])
+
+    def test_hook_offset_after_seek(self) -> None:
+        calls: List[Tuple[str, int, int]] = []
+        instrumentation = Instrumentation(
+            lambda method, offset, size: calls.append((method, offset, size))
+        )
+        writer = CompressedBinaryWriter(ByteOrder.LITTLE, block_size=8)
+        for i in range(10):
+            writer.write_uint32(i)
+        writer.close()
+
+        reader = CompressedBinaryReader(writer.bytes, ByteOrder.LITTLE)
+        instrument(reader, instrumentation)
+        reader.seek(20)
+        self.assertEqual(reader.read_uint32(), 5)
+
+        self.assertEqual(calls, [("read_uint32", 20, 4)])
+
+    def test_pool_release(self) -> None:
+        instrumentation = Instrumentation()
+        pool = WriterPool(ByteOrder.LITTLE)
+        writer = instrument(pool.acquire(), instrumentation)
+
+        pool.release(writer)
+        writer = pool.acquire()
+        writer.write_uint8(1)
+
+        self.assertIs(type(writer), BinaryWriter)
+        self.assertEqual(instrumentation.as_dict(), {})
+
+    def test_uninstrument(self) -> None:
+        instrumentation = Instrumentation()
+        writer = instrument(BinaryWriter(ByteOrder.LITTLE), instrumentation)
+
+        uninstrument(writer)
+        writer.write_uint8(1)
+
+        self.assertIs(type(writer), BinaryWriter)
+        self.assertEqual(instrumentation.as_dict(), {})
+        self.assertEqual(writer.bytes, b"\x01")
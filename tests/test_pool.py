@@ -0,0 +1,118 @@
+import sys
+import threading
+import unittest
+
+from binio import ByteOrder, WriterPool
+
+
+class WriterPoolTests(unittest.TestCase):
+    def test_reuse(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE, prewarm=2)
+
+        self.assertEqual(pool.free, 2)
+        writer = pool.acquire()
+        self.assertEqual(pool.free, 1)
+        writer.write_uint32(1)
+        pool.release(writer)
+
+        self.assertEqual(pool.free, 2)
+        self.assertIs(pool.acquire(), writer)
+        self.assertEqual(writer.bytes, b"")
+
+    def test_writer(self) -> None:
+        pool = WriterPool(ByteOrder.BIG)
+
+        with pool.writer() as writer:
+            writer.write_uint16(128)
+            self.assertEqual(writer.bytes, b"\x00\x80")
+
+        self.assertEqual(pool.free, 1)
+
+    def test_max_buffer_size(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE, max_buffer_size=4)
+
+        writer = pool.acquire()
+        writer.write(b"\x00" * 5)
+        position = writer.stream.tell()
+        pool.release(writer)
+
+        self.assertEqual(pool.free, 0)
+        self.assertEqual(writer.stream.tell(), position)
+
+    def test_max_free(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE, max_free=1)
+
+        writers = [pool.acquire(), pool.acquire()]
+        for writer in writers:
+            pool.release(writer)
+
+        self.assertEqual(pool.free, 1)
+
+    def test_byte_order(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE)
+
+        with self.assertRaises(ValueError):
+            pool.release(WriterPool(ByteOrder.BIG).acquire())
+
+    def test_thread_local(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE, prewarm=1)
+        free = []
+
+        thread = threading.Thread(target=lambda: free.append(pool.free))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(free, [1])
+        self.assertEqual(pool.free, 1)
+
+    def test_thread_local_release(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE)
+        writer = pool.acquire()
+
+        thread = threading.Thread(target=lambda: pool.release(writer))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(pool.free, 0)
+
+    def test_double_release(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE)
+        writer = pool.acquire()
+
+        pool.release(writer)
+        with self.assertRaises(ValueError):
+            pool.release(writer)
+
+        self.assertEqual(pool.free, 1)
+
+    def test_cross_thread_double_release(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE)
+        writer = pool.acquire()
+        pool.release(writer)
+        errors = []
+
+        def release() -> None:
+            try:
+                pool.release(writer)
+            except ValueError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=release)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(pool.free, 1)
+
+    def test_capacity_reused(self) -> None:
+        pool = WriterPool(ByteOrder.LITTLE)
+
+        writer = pool.acquire()
+        writer.write(b"\x01" * 1024)
+        capacity = sys.getsizeof(writer.stream)
+        pool.release(writer)
+
+        writer = pool.acquire()
+        self.assertGreaterEqual(sys.getsizeof(writer.stream), capacity)
+        writer.write_uint16(2)
+        self.assertEqual(writer.bytes, b"\x02\x00")